@@ -8,6 +8,7 @@ from uesgraphs.examples import e3_add_network as e3
 from uesgraphs.examples import e6_additional_building_attributes as e6
 from uesgraphs.examples import e7_plot_uesgraphs as e7
 import math
+import pytest
 import shapely.geometry as sg
 
 
@@ -79,6 +80,21 @@ class Test_uesgraphs(object):
         assert len(building_graph.nodes()) == 8
         assert len(building_graph.edges()) == 0
 
+    def test_subgraph_independence(self):
+        """Tests that changing a subgraph leaves the original graph unchanged
+        """
+        example_district = e2.simple_dhc_model()
+        nodelist = list(example_district.nodelists_heating['default'])
+
+        heating_network = example_district.create_subgraphs('heating')[
+            'default']
+        heating_network.remove_network_node(nodelist[0])
+        heating_network.graph['subgraph_only'] = True
+
+        assert example_district.nodelists_heating['default'] == nodelist
+        assert nodelist[0] in example_district.nodes()
+        assert 'subgraph_only' not in example_district.graph
+
     def test_plot_example_networks(self):
         """Runs the example network plotting to make sure example works
         """
@@ -203,3 +219,32 @@ class Test_uesgraphs(object):
         assert len(example_district.edges()) == 12, msg
         assert removed == [1015], msg
 
+    def test_calc_total_building_ground_area(self):
+        """Tests the calc_total_building_ground_area() method
+        """
+        test_graph = ug.UESGraph()
+        test_graph.add_building(position=sg.Point(0, 0), area=100.)
+        test_graph.add_building(position=sg.Point(10, 0), area=50.)
+        test_graph.add_building(position=sg.Point(20, 0))
+        test_graph.add_building(position=sg.Point(30, 0), area=None)
+
+        with pytest.warns(UserWarning):
+            total_area = test_graph.calc_total_building_ground_area()
+
+        assert total_area == 150.
+
+    def test_remove_building(self):
+        """Tests the remove_building() method
+        """
+        test_graph = ug.UESGraph()
+        building_1 = test_graph.add_building(position=sg.Point(0, 0))
+        building_2 = test_graph.add_building(position=sg.Point(10, 0))
+        street = test_graph.add_street_node(position=sg.Point(5, 5))
+
+        test_graph.remove_building(building_1)
+        assert building_1 not in test_graph.nodes()
+        assert test_graph.nodelist_building == [building_2]
+
+        with pytest.warns(UserWarning):
+            test_graph.remove_building(street)
+        assert street in test_graph.nodes()
@@ -104,13 +104,9 @@ def make_workspace(name_workspace=None):
     this_dir = os.path.dirname(__file__)
     ues_dir = os.path.dirname(os.path.dirname(this_dir))
     workspace = os.path.join(ues_dir, 'workspace')
-    if not os.path.exists(workspace):
-        os.mkdir(workspace)
-
     if name_workspace is not None:
         workspace = os.path.join(workspace, name_workspace)
-        if not os.path.exists(workspace):
-            os.mkdir(workspace)
+    os.makedirs(workspace, exist_ok=True)
 
     return workspace
 
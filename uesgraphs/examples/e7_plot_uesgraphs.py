@@ -96,7 +96,6 @@ def plot_example_networks():
     # Plot network in 3d layout
 
     save_as = os.path.join(workspace, '09_network_3d.png')
-    vis = ug.Visuals(example_district)
     vis.network_explosion(save_as=save_as, show_plot=False, angle=250,
                           scaling_factor=scaling_factor * 5,
                           networks=[])
@@ -104,7 +103,6 @@ def plot_example_networks():
     # Plot network explosion
 
     save_as = os.path.join(workspace, '10_network_explosion.png')
-    vis = ug.Visuals(example_district)
     vis.network_explosion(save_as=save_as, show_plot=False, angle=250,
                           scaling_factor=scaling_factor * 5)
 
@@ -112,7 +110,6 @@ def plot_example_networks():
 
     save_as = os.path.join(workspace, '11_simple.png')
     scaling_factor = 50
-    vis = ug.Visuals(example_district)
     fig = vis.show_network(
         save_as=save_as,
         show_plot=False,
@@ -292,13 +289,9 @@ def make_workspace(name_workspace=None):
     this_dir = os.path.dirname(__file__)
     ues_dir = os.path.dirname(os.path.dirname(this_dir))
     workspace = os.path.join(ues_dir, 'workspace')
-    if not os.path.exists(workspace):
-        os.mkdir(workspace)
-
     if name_workspace is not None:
         workspace = os.path.join(workspace, name_workspace)
-        if not os.path.exists(workspace):
-            os.mkdir(workspace)
+    os.makedirs(workspace, exist_ok=True)
 
     return workspace
 
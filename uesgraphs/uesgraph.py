@@ -127,12 +127,11 @@ class UESGraph(nx.Graph):
 
     @property
     def positions(self):
-        for node in self.nodes(data=True):
-            if node[0] is not None:
-                assert 'position' in node[1], 'No position for:' + str(node[0])
-                if node[1]['position'] is not None:
-                    self.__positions[node[0]] = np.array([node[1][
-                        'position'].x, node[1]['position'].y])
+        for node, data in self.nodes(data=True):
+            assert 'position' in data, 'No position for:' + str(node)
+            if data['position'] is not None:
+                self.__positions[node] = np.array([data['position'].x,
+                                                   data['position'].y])
         return self.__positions
 
     @positions.setter
@@ -172,18 +171,31 @@ class UESGraph(nx.Graph):
             Name of the new network
         """
         assert network_type in self.network_types, 'Network type not known'
-        assert type(network_id) == type(str()), 'Network name must be a string'
+        assert isinstance(network_id, str), 'Network name must be a string'
 
-        if network_type == 'heating':
-            self.nodelists_heating[network_id] = []
-        elif network_type == 'cooling':
-            self.nodelists_cooling[network_id] = []
-        elif network_type == 'electricity':
-            self.nodelists_electricity[network_id] = []
-        elif network_type == 'gas':
-            self.nodelists_gas[network_id] = []
-        elif network_type == 'others':
-            self.nodelists_others[network_id] = []
+        self._network_nodelists(network_type)[network_id] = []
+
+    def _network_nodelists(self, network_type):
+        """Returns the nodelists dict for the given network type
+
+        Parameters
+        ----------
+        network_type : str
+            Specifies the type of the network as {'heating', 'cooling',
+            'electricity', 'gas', 'others'}
+
+        Returns
+        -------
+        nodelists : dict
+            Dictionary of network ids and their lists of node numbers, e.g.
+            `self.nodelists_heating` for `network_type='heating'`
+        """
+        return {'heating': self.nodelists_heating,
+                'cooling': self.nodelists_cooling,
+                'electricity': self.nodelists_electricity,
+                'gas': self.nodelists_gas,
+                'others': self.nodelists_others,
+                }[network_type]
 
     def _update_min_max_positions(self, position):
         """Updates values for min_positions and max_positions
@@ -193,7 +205,7 @@ class UESGraph(nx.Graph):
         position : shapely.geometry.Point
             Definition of the node position with a Point object
         """
-        if type(position) == type(sg.Point(0, 0)):
+        if isinstance(position, sg.Point):
             if self.min_position is None:
                 self.min_position = position
             else:
@@ -276,8 +288,7 @@ class UESGraph(nx.Graph):
         self._update_min_max_positions(position)
 
         self.add_node(node_for_adding=node_number)
-        for key in attr_dict_ues.keys():
-            self.nodes[node_number][key] = attr_dict_ues[key]
+        self.nodes[node_number].update(attr_dict_ues)
 
         self.nodelist_building.append(node_number)
 
@@ -293,12 +304,13 @@ class UESGraph(nx.Graph):
         node_number : int
             Identifier of the node in the graph
         """
-        if node_number in self.nodelist_building:
+        try:
             self.nodelist_building.remove(node_number)
-            self.remove_node(node_number)
-        else:
+        except ValueError:
             warnings.warn('Node number has not been found in building' +
                           'nodelist. Therefore, node has not been removed.')
+        else:
+            self.remove_node(node_number)
 
     def add_street_node(self,
                         position,
@@ -355,8 +367,7 @@ class UESGraph(nx.Graph):
             return check_node
         else:
             self.add_node(node_for_adding=node_number)
-            for key in attr_dict_ues.keys():
-                self.nodes[node_number][key] = attr_dict_ues[key]
+            self.nodes[node_number].update(attr_dict_ues)
             self.nodelist_street.append(node_number)
 
             return node_number
@@ -370,12 +381,13 @@ class UESGraph(nx.Graph):
         node_number : int
             Identifier of the node in the graph
         """
-        if node_number in self.nodelist_street:
+        try:
             self.nodelist_street.remove(node_number)
-            self.remove_node(node_number)
-        else:
+        except ValueError:
             warnings.warn('Node number has not been found in street ' +
                           'nodelist. Therefore, node has not been removed.')
+        else:
+            self.remove_node(node_number)
 
     def add_network_node(self,
                          network_type,
@@ -445,16 +457,7 @@ class UESGraph(nx.Graph):
 
         self._update_min_max_positions(position)
 
-        if network_type == 'heating':
-            nodelist = self.nodelists_heating[network_id]
-        elif network_type == 'cooling':
-            nodelist = self.nodelists_cooling[network_id]
-        elif network_type == 'electricity':
-            nodelist = self.nodelists_electricity[network_id]
-        elif network_type == 'gas':
-            nodelist = self.nodelists_gas[network_id]
-        elif network_type == 'others':
-            nodelist = self.nodelists_others[network_id]
+        nodelist = self._network_nodelists(network_type)[network_id]
 
         # Check if there is already a node at the given position
         if check_overlap is True:
@@ -471,34 +474,10 @@ class UESGraph(nx.Graph):
 
             if check_node is not None:
                 return check_node
-            else:
-                self.add_node(node_for_adding=node_number)
-                for key in attr_dict_ues.keys():
-                    self.nodes[node_number][key] = attr_dict_ues[key]
-                if network_type == 'heating':
-                    nodelist.append(node_number)
-                elif network_type == 'cooling':
-                    nodelist.append(node_number)
-                elif network_type == 'electricity':
-                    nodelist.append(node_number)
-                elif network_type == 'gas':
-                    nodelist.append(node_number)
-                elif network_type == 'others':
-                    nodelist.append(node_number)
-        else:
-            self.add_node(node_for_adding=node_number)
-            for key in attr_dict_ues.keys():
-                self.nodes[node_number][key] = attr_dict_ues[key]
-            if network_type == 'heating':
-                nodelist.append(node_number)
-            elif network_type == 'cooling':
-                nodelist.append(node_number)
-            elif network_type == 'electricity':
-                nodelist.append(node_number)
-            elif network_type == 'gas':
-                nodelist.append(node_number)
-            elif network_type == 'others':
-                nodelist.append(node_number)
+
+        self.add_node(node_for_adding=node_number)
+        self.nodes[node_number].update(attr_dict_ues)
+        nodelist.append(node_number)
 
         self.nodes_by_name[name] = node_number
 
@@ -513,20 +492,18 @@ class UESGraph(nx.Graph):
             Identifier of the node in the graph
         """
         #  Search for occurrence of node number within different network dicts
-        network_list = [self.nodelists_heating, self.nodelists_cooling,
+        network_list = (self.nodelists_heating, self.nodelists_cooling,
                         self.nodelists_electricity, self.nodelists_gas,
-                        self.nodelists_others]
+                        self.nodelists_others)
 
         found_node = False
 
         for nodelists in network_list:
             for network in nodelists:
-                for node_id in nodelists[network]:
-                    if node_id == node_number:
-                        found_node = True
-                        found_nodelists = nodelists
-                        found_network = network
-                        break
+                if node_number in nodelists[network]:
+                    found_node = True
+                    found_nodelists = nodelists
+                    found_network = network
 
         if found_node:
             found_nodelists[found_network].remove(node_number)
@@ -548,7 +525,7 @@ class UESGraph(nx.Graph):
         node_number : int
             Number of the corresponding node
         """
-        if name in self.nodes_by_name.keys():
+        if name in self.nodes_by_name:
             return self.nodes_by_name[name]
         else:
             print(name, 'not known')
@@ -574,11 +551,11 @@ class UESGraph(nx.Graph):
         """
         result_dict = {}
 
-        for node in self:
-            if 'position' in self.nodes[node]:
+        for node, data in self.nodes(data=True):
+            if 'position' in data:
                 #  If positions are identical, save name and node_id to dict
-                if self.nodes[node]['position'].distance(position) < resolution:
-                    node_name = self.nodes[node]['name']
+                if data['position'].distance(position) < resolution:
+                    node_name = data['name']
                     result_dict[node] = node_name
 
         return result_dict
@@ -608,18 +585,10 @@ class UESGraph(nx.Graph):
         assert network_type in self.network_types or network_type is None or\
             network_type == 'proximity', 'Network type not known'
 
-        if network_type == 'heating':
-            nodelists = self.nodelists_heating
-        elif network_type == 'cooling':
-            nodelists = self.nodelists_cooling
-        elif network_type == 'electricity':
-            nodelists = self.nodelists_electricity
-        elif network_type == 'gas':
-            nodelists = self.nodelists_gas
-        elif network_type == 'others':
-            nodelists = self.nodelists_others
-        elif network_type is None:
+        if network_type is None or network_type == 'proximity':
             nodelists = {}
+        else:
+            nodelists = self._network_nodelists(network_type)
 
         subgraphs = {}
 
@@ -647,26 +616,14 @@ class UESGraph(nx.Graph):
                                         n, nbr][attr]
 
 
-                    H.graph = self.graph
+                    # Subgraphs get their own containers, so that changes to
+                    # a subgraph do not alter the original uesgraph
+                    H.graph.update(self.graph)
                     for building in self.nodelist_building:
                         H.nodelist_building.append(building)
-                    if network_type == 'heating':
-                        H.nodelists_heating[
-                            network_id] = self.nodelists_heating[network_id]
-                    elif network_type == 'cooling':
-                        H.nodelists_cooling[
-                            network_id] = self.nodelists_cooling[network_id]
-                    elif network_type == 'electricity':
-                        H.nodelists_electricity[
-                            network_id] = self.nodelists_electricity[
-                                network_id]
-                    elif network_type == 'gas':
-                        H.nodelists_gas[
-                            network_id] = self.nodelists_gas[network_id]
-                    elif network_type == 'others':
-                        H.nodelists_others[
-                            network_id] = self.nodelists_others[network_id]
-                    H.nodes_by_name = self.nodes_by_name
+                    H._network_nodelists(network_type)[
+                        network_id] = list(nodelists[network_id])
+                    H.nodes_by_name.update(self.nodes_by_name)
                     subgraphs[network_id] = H
 
             if all_buildings is False:
@@ -772,6 +729,16 @@ class UESGraph(nx.Graph):
             self.input_ids['nodes'] = nodes['meta']['input_id']
 
         node_mapping = {}
+        already_processed = frozenset([
+            'longitude',
+            'latitude',
+            'x',
+            'y',
+            'name',
+            'is_supply_heating',
+            'is_supply_cooling',
+            'node_type',
+        ])
         print('******')
         for node in nodes['nodes']:
             # Create position object
@@ -818,19 +785,10 @@ class UESGraph(nx.Graph):
                 )
 
             # Read additional attributes that have not yet been processed
-            already_processed = [
-                'longitude',
-                'latitude',
-                'x',
-                'y',
-                'name',
-                'is_supply_heating',
-                'is_supply_cooling',
-                'node_type',
-            ]
+            new_node_data = self.nodes[new_node]
             for attrib in node.keys():
                 if attrib not in already_processed:
-                    self.nodes[new_node][attrib] = node[attrib]
+                    new_node_data[attrib] = node[attrib]
 
             # Add node to node mapping
             node_mapping[node['name']] = new_node
@@ -910,8 +868,7 @@ class UESGraph(nx.Graph):
         """
         if path is not None:
             workspace = os.path.join(path)
-            if not os.path.exists(workspace):
-                os.mkdir(workspace)
+            os.makedirs(workspace, exist_ok=True)
 
         nodes = []
         edges = []
@@ -927,6 +884,9 @@ class UESGraph(nx.Graph):
                           }
                 }
 
+        # Names written for each node, reused for the edges' node_0/node_1
+        node_names = {}
+
         # Write node data from uesgraph to dict for json output
         for node in self.nodes():
             nodes.append({'x': self.nodes[node]['position'].x,
@@ -936,6 +896,7 @@ class UESGraph(nx.Graph):
                 nodes[-1]['name'] = self.nodes[node]['name']
             else:
                 nodes[-1]['name'] = str(node)
+            node_names[node] = nodes[-1]['name']
             if 'node_type' in self.nodes[node]:
                 node_type = self.nodes[node]['node_type']
                 if 'building' in node_type:
@@ -952,51 +913,42 @@ class UESGraph(nx.Graph):
                         nodes[-1][key] = self.nodes[node][key]
 
         # Write pipe data from uesgraph to dict for json output
-        for edge in self.edges():
-            if 'pipeID' in self.edges[edge[0], edge[1]]:
+        for edge in self.edges(data=True):
+            edge_data = edge[2]
+            if 'pipeID' in edge_data:
                 try:
-                    pipe_id = str(
-                        int(self.edges[edge[0], edge[1]]['pipeID']))
+                    pipe_id = str(int(edge_data['pipeID']))
                 except:
-                    pipe_id = self.edges[edge[0], edge[1]]['pipeID']
+                    pipe_id = edge_data['pipeID']
             else:
                 pipe_id = str(edge[0]) + str(edge[1])
 
-            if 'name' in self.nodes[edge[0]]:
-                name_0 = self.nodes[edge[0]]['name']
-            else:
-                name_0 = str(edge[0])
-            if 'name' in self.nodes[edge[1]]:
-                name_1 = self.nodes[edge[1]]['name']
-            else:
-                name_1 = str(edge[1])
-
-            edges.append({'node_0': name_0,
-                          'node_1': name_1,
+            edges.append({'node_0': node_names[edge[0]],
+                          'node_1': node_names[edge[1]],
                           'pipeID': str(pipe_id),
                           'name': str(pipe_id),
                           })
 
-            if 'length' in self.edges[edge[0], edge[1]]:
-                length = self.edges[edge[0], edge[1]]['length']
+            if 'length' in edge_data:
+                length = edge_data['length']
             else:
                 pos_0 = self.nodes[edge[0]]['position']
                 pos_1 = self.nodes[edge[1]]['position']
                 length = pos_0.distance(pos_1)
             edges[-1]['length'] = length
 
-            if 'diameter' in self.edges[edge[0], edge[1]]:
-                diameter = self.edges[edge[0], edge[1]]['diameter']
+            if 'diameter' in edge_data:
+                diameter = edge_data['diameter']
                 edges[-1]['diameter'] = diameter
 
-            if 'lambda_insulation' in self.edges[edge[0], edge[1]]:
-                lambda_insulation = self.edges[edge[0], edge[1]]['lambda_insulation']
+            if 'lambda_insulation' in edge_data:
+                lambda_insulation = edge_data['lambda_insulation']
                 edges[-1]['lambda_insulation'] = lambda_insulation
 
             if all_data is True:
-                for key in self.edges[edge[0], edge[1]]:
+                for key in edge_data:
                     if key not in edges[-1]:
-                        edges[-1][key] = self.edges[edge[0], edge[1]][key]
+                        edges[-1][key] = edge_data[key]
 
         # Write json files
         output_data = {'meta': meta,
@@ -1012,7 +964,9 @@ class UESGraph(nx.Graph):
                               indent=4
                               )
                 else:
-                    json.dump(output_data, outfile)
+                    json.dump(output_data, outfile,
+                              separators=(',', ':')
+                              )
         return output_data
 
     def from_osm(self,
@@ -1108,7 +1062,7 @@ class UESGraph(nx.Graph):
                                      }
 
         # Define street tags to be used in uesgraph
-        street_tags = ['motorway',
+        street_tags = {'motorway',
                        'trunk',
                        'primary',
                        'secondary',
@@ -1116,14 +1070,18 @@ class UESGraph(nx.Graph):
                        'unclassified',
                        'residential',
                        'service',
-                       ]
+                       }
 
         streets = []
         # Get city boundaries
         print('Creating boundary polygon...')
         if check_boundary is True:
+            # Index ways by id once instead of scanning all ways per member
+            ways_by_id = {}
+            for way in root.findall('way'):
+                ways_by_id.setdefault(way.get('id'), []).append(way)
+
             city_boundaries_ways = []
-            way_counter = 0
             for relation in root.findall('relation'):
                 for tag in relation.findall('tag'):
                     if tag.get('k') == 'name' and tag.get(
@@ -1131,19 +1089,17 @@ class UESGraph(nx.Graph):
                         for member in relation.findall('member'):
                             if member.get('type') == 'way':
                                 curr_ref = member.get('ref')
-                                for way in root.findall('way'):
-                                    if way.get('id') == curr_ref:
-                                        curr_points = []
-                                        for nd in way.findall('nd'):
-                                            curr_lon = nodes[nd.get('ref')][
-                                                'lon']
-                                            curr_lat = nodes[nd.get('ref')][
-                                                'lat']
-                                            curr_points.append(sg.Point(
-                                                curr_lon, curr_lat))
-                                        curr_way = sg.LineString(curr_points)
-                                        city_boundaries_ways.append(curr_way)
-                                        way_counter += 1
+                                for way in ways_by_id.get(curr_ref, []):
+                                    curr_points = []
+                                    for nd in way.findall('nd'):
+                                        curr_lon = nodes[nd.get('ref')][
+                                            'lon']
+                                        curr_lat = nodes[nd.get('ref')][
+                                            'lat']
+                                        curr_points.append(sg.Point(
+                                            curr_lon, curr_lat))
+                                    curr_way = sg.LineString(curr_points)
+                                    city_boundaries_ways.append(curr_way)
 
             # Create one boundary polygon
             end_points = []
@@ -1198,42 +1154,40 @@ class UESGraph(nx.Graph):
                 outlines_building.append([curr_lat, curr_lon])
 
             for tag in way.findall('tag'):
-                if tag.get('k') == 'building':
+                key = tag.get('k')
+                value = tag.get('v')
+                if key == 'building':
                     if len(curr_positions) > 2:
                         curr_way = sg.Polygon(curr_positions)
                         curr_dict['polygon'] = curr_way
                         curr_dict['outlines'] = outlines_building
-                        curr_dict['comment'] = tag.get('v')
+                        curr_dict['comment'] = value
                         is_building = True
-                if tag.get('k') == 'addr:housenumber':
-                    curr_dict['addr_housenumber'] = tag.get('v')
-                if tag.get('k') == 'addr:street':
-                    curr_dict['addr_street'] = tag.get('v')
-                if tag.get('k') == 'building:levels':
-                    curr_dict['building_levels'] = tag.get('v')
-                if tag.get('k') == 'leisure':
-                    curr_dict['leisure'] = tag.get('v')
-                if tag.get('k') == 'name':
-                    curr_dict['name'] = tag.get('v')
-                if tag.get('k') == 'shop':
-                    curr_dict['shop'] = tag.get('v')
-                if tag.get('k') == 'amenity':
-                    curr_dict['amenity'] = tag.get('v')
-                if tag.get('k') == 'building:roof:shape':
-                    curr_dict['building_roof_shape'] = tag.get('v')
-                if tag.get('k') == 'building:buildyear':
-                    curr_dict['building_buildyear'] = tag.get('v')
-                if tag.get('k') == 'building:condition':
-                    curr_dict['building_condition'] = tag.get('v')
-                if tag.get('k') == 'building:height':
-                    curr_dict['building_height'] = tag.get('v')
-
-                if tag.get('k') == 'highway' and tag.get('v') in street_tags:
-                    all_street_ways.append([])
-                    for i in range(len(curr_positions)):
-                        curr_position = sg.Point(curr_positions[i][0],
-                                                 curr_positions[i][1])
-                        all_street_ways[-1].append(curr_position)
+                elif key == 'addr:housenumber':
+                    curr_dict['addr_housenumber'] = value
+                elif key == 'addr:street':
+                    curr_dict['addr_street'] = value
+                elif key == 'building:levels':
+                    curr_dict['building_levels'] = value
+                elif key == 'leisure':
+                    curr_dict['leisure'] = value
+                elif key == 'name':
+                    curr_dict['name'] = value
+                elif key == 'shop':
+                    curr_dict['shop'] = value
+                elif key == 'amenity':
+                    curr_dict['amenity'] = value
+                elif key == 'building:roof:shape':
+                    curr_dict['building_roof_shape'] = value
+                elif key == 'building:buildyear':
+                    curr_dict['building_buildyear'] = value
+                elif key == 'building:condition':
+                    curr_dict['building_condition'] = value
+                elif key == 'building:height':
+                    curr_dict['building_height'] = value
+                elif key == 'highway' and value in street_tags:
+                    all_street_ways.append([sg.Point(curr_position) for
+                                            curr_position in curr_positions])
             if is_building is True:
                 all_building_data[way.get('id')] = curr_dict
 
@@ -1255,7 +1209,18 @@ class UESGraph(nx.Graph):
             street_ways = all_street_ways
 
         print('Add buildings to graph...')
-        counter = 0
+        optional_building_keys = ('addr_street',
+                                  'addr_housenumber',
+                                  'building_levels',
+                                  'leisure',
+                                  'name',
+                                  'shop',
+                                  'amenity',
+                                  'building_roof_shape',
+                                  'building_buildyear',
+                                  'building_condition',
+                                  'building_height',
+                                  )
         curr_keys = list(building_data.keys())
         ordered_keys = sorted(curr_keys)  # Same node ids for same input
         for id in ordered_keys:
@@ -1264,46 +1229,15 @@ class UESGraph(nx.Graph):
             geom_aea = latlon2abs(curr_way,
                                   curr_way.bounds[1],
                                   curr_way.bounds[3])
-            counter += 1
             building = self.add_building(position=curr_position)
             self.nodes[building]['area'] = geom_aea.area
             self.nodes[building]['osm_id'] = id
             self.nodes[building]['polygon'] = building_data[id]['polygon']
             self.nodes[building]['outlines'] = building_data[id]['outlines']
             self.nodes[building]['comment'] = building_data[id]['comment']
-            if 'addr_street' in building_data[id]:
-                self.nodes[building]['addr_street'] = building_data[id][
-                    'addr_street']
-            if 'addr_housenumber' in building_data[id]:
-                self.nodes[building]['addr_housenumber'] = building_data[id][
-                    'addr_housenumber']
-            if 'building_levels' in building_data[id]:
-                self.nodes[building]['building_levels'] = building_data[id][
-                    'building_levels']
-            if 'leisure' in building_data[id]:
-                self.nodes[building]['leisure'] = building_data[id][
-                    'leisure']
-            if 'name' in building_data[id]:
-                self.nodes[building]['name'] = building_data[id][
-                    'name']
-            if 'shop' in building_data[id]:
-                self.nodes[building]['shop'] = building_data[id][
-                    'shop']
-            if 'amenity' in building_data[id]:
-                self.nodes[building]['amenity'] = building_data[id][
-                    'amenity']
-            if 'building_roof_shape' in building_data[id]:
-                self.nodes[building]['building_roof_shape'] = building_data[id][
-                    'building_roof_shape']
-            if 'building_buildyear' in building_data[id]:
-                self.nodes[building]['building_buildyear'] = building_data[id][
-                    'building_buildyear']
-            if 'building_condition' in building_data[id]:
-                self.nodes[building]['building_condition'] = building_data[id][
-                    'building_condition']
-            if 'building_height' in building_data[id]:
-                    self.nodes[building]['building_height'] = building_data[id][
-                        'building_height']
+            for key in optional_building_keys:
+                if key in building_data[id]:
+                    self.nodes[building][key] = building_data[id][key]
 
         print('Add streets to graph...')
         for street_way in street_ways:
@@ -1390,18 +1324,16 @@ class UESGraph(nx.Graph):
             number_of_nodes = len(self.nodelist_street)
         else:
             if node_type == 'heating':
-                nodelists = list(self.nodelists_heating.values())
+                nodelists = self.nodelists_heating.values()
             elif node_type == 'cooling':
-                nodelists = list(self.nodelists_cooling.values())
+                nodelists = self.nodelists_cooling.values()
             elif node_type == 'electricity':
-                nodelists = list(self.nodelists_electricity.values())
+                nodelists = self.nodelists_electricity.values()
             elif node_type == 'gas':
-                nodelists = list(self.nodelists_gas.values())
+                nodelists = self.nodelists_gas.values()
             elif node_type == 'other':
-                nodelists = list(self.nodelists_others.values())
-            number_of_nodes = 0
-            for nodelist in nodelists:
-                number_of_nodes += len(nodelist)
+                nodelists = self.nodelists_others.values()
+            number_of_nodes = sum(len(nodelist) for nodelist in nodelists)
 
         return number_of_nodes
 
@@ -1451,8 +1383,9 @@ class UESGraph(nx.Graph):
         total_ground_area = 0
         counter = 0
         for building in self.nodelist_building:
-            if 'area' in self.nodes[building]:
-                total_ground_area += self.nodes[building]['area']
+            area = self.nodes[building].get('area')
+            if area is not None:
+                total_ground_area += area
             else:
                 counter += 1
 
@@ -1574,32 +1507,21 @@ class UESGraph(nx.Graph):
                 fac_weights = 0
                 m_flow_nom_weights = 0
                 for i in range(len(shortest_path)-1):
-                    length = self.edges[shortest_path[i], shortest_path[
-                        i+1]]['length']
-                    diameter = self.edges[shortest_path[i], shortest_path[
-                        i+1]]['diameter']
+                    edge_data = self.edges[shortest_path[i],
+                                           shortest_path[i+1]]
+                    length = edge_data['length']
+                    diameter = edge_data['diameter']
                     length_total += length
                     diameter_weights += diameter * length
-                    if 'dIns' in self.edges[shortest_path[i],
-                                            shortest_path[i+1]]:
-                        dIns = self.edges[shortest_path[i], shortest_path[
-                            i+1]]['dIns']
-                        dIns_weights += dIns * length
-                    if 'kIns' in self.edges[shortest_path[i],
-                                            shortest_path[i+1]]:
-                        kIns = self.edges[shortest_path[i], shortest_path[
-                            i+1]]['kIns']
-                        kIns_weights += kIns * length
-                    if 'fac' in self.edges[shortest_path[i],
-                                            shortest_path[i+1]]:
-                        fac = self.edges[shortest_path[i], shortest_path[
-                            i+1]]['fac']
-                        fac_weights += fac * length
-                    if 'm_flow_nominal' in self.edges[shortest_path[i],
-                                            shortest_path[i+1]]:
-                        m_flow_nominal = self.edges[shortest_path[i],
-                            shortest_path[i+1]]['m_flow_nominal']
-                        m_flow_nom_weights += m_flow_nominal * length
+                    if 'dIns' in edge_data:
+                        dIns_weights += edge_data['dIns'] * length
+                    if 'kIns' in edge_data:
+                        kIns_weights += edge_data['kIns'] * length
+                    if 'fac' in edge_data:
+                        fac_weights += edge_data['fac'] * length
+                    if 'm_flow_nominal' in edge_data:
+                        m_flow_nom_weights += edge_data[
+                            'm_flow_nominal'] * length
 
                 for node in group['path']:
                     self.remove_network_node(node)
@@ -1609,19 +1531,17 @@ class UESGraph(nx.Graph):
                               diameter=diameter_weights/length_total,
                               pipeID='{}{}'.format(group['ends'][0],
                                                    group['ends'][1]))
+                new_edge_data = self.edges[group['ends'][0], group['ends'][1]]
 
                 if dIns_weights != 0:
-                    self.edges[group['ends'][0], group['ends'][1]][
-                        'dIns'] = dIns_weights / length_total
+                    new_edge_data['dIns'] = dIns_weights / length_total
                 if kIns_weights != 0:
-                    self.edges[group['ends'][0], group['ends'][1]][
-                        'kIns'] = kIns_weights / length_total
+                    new_edge_data['kIns'] = kIns_weights / length_total
                 if fac_weights != 0:
-                    self.edges[group['ends'][0], group['ends'][1]][
-                        'fac'] = fac_weights / length_total
+                    new_edge_data['fac'] = fac_weights / length_total
                 if m_flow_nom_weights != 0:
-                    self.edges[group['ends'][0], group['ends'][1]][
-                        'm_flow_nominal'] = m_flow_nom_weights / length_total
+                    new_edge_data['m_flow_nominal'] = \
+                        m_flow_nom_weights / length_total
 
         self.simplification_level = 1
 
@@ -1646,6 +1566,7 @@ class UESGraph(nx.Graph):
             Names of removed network nodes
         """
         removed = []
+        removed_set = set()
         if network_type == 'heating':
             is_supply = 'is_supply_heating'
             nodelist = self.nodelists_heating[network_id]
@@ -1664,10 +1585,8 @@ class UESGraph(nx.Graph):
             counter += 1
             curr_removed = []
             for node in nodelist:
-                connected = False
-                for supply in supplies:
-                    if nx.has_path(self, node, supply):
-                        connected = True
+                connected = any(nx.has_path(self, node, supply)
+                                for supply in supplies)
                 if connected is False:
                     if 'name' in self.nodes[node]:
                         curr_removed.append(self.nodes[node]['name'])
@@ -1679,7 +1598,8 @@ class UESGraph(nx.Graph):
                 accept = True
             else:
                 for node in curr_removed:
-                    if node not in removed:
+                    if node not in removed_set:
+                        removed_set.add(node)
                         removed.append(node)
 
         if counter == max_iter:
@@ -1705,8 +1625,8 @@ class UESGraph(nx.Graph):
         """
         number_removed_edges = 0
         to_remove = []
-        for edge in self.edges():
-            if self.edges[edge[0], edge[1]]['length'] <= 1e-9:
+        for edge in self.edges(data=True):
+            if edge[2]['length'] <= 1e-9:
                 if edge[0] == edge[1]:
                     to_remove.append([edge[0], edge[1]])
                     
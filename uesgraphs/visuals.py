@@ -12,7 +12,6 @@ from matplotlib import gridspec
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
-import random
 import shapely.geometry as sg
 import sys
 import warnings
@@ -52,8 +51,6 @@ class Visuals(object):
         -------
         ax : maplotlib ax object
         """
-        counter = 0
-
         for street in self.uesgraph.nodelist_street:
             ax.scatter(self.uesgraph.node[street]['position'].x,
                        self.uesgraph.node[street]['position'].y,
@@ -63,9 +60,6 @@ class Visuals(object):
 
         for nodelist_heating in list(self.uesgraph.nodelists_heating.values()):
             for heating_node in nodelist_heating:
-                y_offset = random.choice([0.0001, 0.0002, 0.00015])
-                x_offset = random.choice([0.0005, 0.00055, 0.0006, 0.00065,
-                                          0.0007])
                 ax.scatter(self.uesgraph.node[heating_node]['position'].x,
                            self.uesgraph.node[heating_node]['position'].y,
                            s=scaling_factor*15,
@@ -119,7 +113,6 @@ class Visuals(object):
                                s=scaling_factor * 25,
                                color='red',
                                alpha=0.7)
-                counter += 1
 
         if 'proximity' in self.uesgraph.graph:
             try:
@@ -283,24 +276,27 @@ class Visuals(object):
         """
         assert show_diameters is False or show_mass_flows is False
 
+        # `UESGraph.positions` is rebuilt from all node positions on every
+        # access, so it is evaluated once for all drawing calls below
+        positions = self.uesgraph.positions
+
         if show_mass_flows is True:
             mass_flow_max = 0
             volume_flows = [0]
-            for edge in self.uesgraph.edges():
-                if 'mass_flow' in self.uesgraph.edges[edge[0], edge[1]]:
-                    curr_m = abs(self.uesgraph.edges[
-                        edge[0], edge[1]]['mass_flow'])
+            for edge in self.uesgraph.edges(data=True):
+                edge_data = edge[2]
+                if 'mass_flow' in edge_data:
+                    curr_m = abs(edge_data['mass_flow'])
                     if curr_m > mass_flow_max:
                         mass_flow_max = curr_m
-                if 'volume_flow' in self.uesgraph.edges[edge[0], edge[1]]:
-                    volume_flows.append(abs(self.uesgraph.edges[
-                        edge[0], edge[1]]['volume_flow']))
+                if 'volume_flow' in edge_data:
+                    volume_flows.append(abs(edge_data['volume_flow']))
 
             volume_flow_max = max(volume_flows)
 
         for street in self.uesgraph.nodelist_street:
             draw = nx.draw_networkx_nodes(self.uesgraph,
-                                          pos=self.uesgraph.positions,
+                                          pos=positions,
                                           nodelist=[street],
                                           node_size=2 * scaling_factor,
                                           node_color='black',
@@ -319,7 +315,7 @@ class Visuals(object):
         for heat_network in self.uesgraph.nodelists_heating.keys():
             for node in self.uesgraph.nodelists_heating[heat_network]:
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[node],
                                               node_color='red',
                                               node_size=3 * scaling_factor,
@@ -344,7 +340,7 @@ class Visuals(object):
         for cool_network in self.uesgraph.nodelists_cooling.keys():
             for node in self.uesgraph.nodelists_cooling[cool_network]:
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[node],
                                               node_color='blue',
                                               node_size=1,
@@ -355,7 +351,7 @@ class Visuals(object):
         for elec_network in self.uesgraph.nodelists_electricity.keys():
             for node in self.uesgraph.nodelists_electricity[elec_network]:
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[node],
                                               node_color='orange',
                                               node_size=3 * scaling_factor,
@@ -365,7 +361,7 @@ class Visuals(object):
         for gas_network in self.uesgraph.nodelists_gas.keys():
             for node in self.uesgraph.nodelists_gas[gas_network]:
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[node],
                                               node_color='gray',
                                               node_size=3 * scaling_factor,
@@ -375,7 +371,7 @@ class Visuals(object):
         for other_network in self.uesgraph.nodelists_others.keys():
             for node in self.uesgraph.nodelists_others[other_network]:
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[node],
                                               node_color='purple',
                                               node_size=3 * scaling_factor,
@@ -387,7 +383,7 @@ class Visuals(object):
             if self.uesgraph.node[building]['position'] is not None:
                 if self.uesgraph.node[building]['is_supply_heating'] is True:
                     draw = nx.draw_networkx_nodes(self.uesgraph,
-                                                  pos=self.uesgraph.positions,
+                                                  pos=positions,
                                                   nodelist=[building],
                                                   node_color='red',
                                                   node_size=90 *
@@ -397,7 +393,7 @@ class Visuals(object):
                         draw.set_edgecolor('red')
                 if self.uesgraph.node[building]['is_supply_cooling'] is True:
                     draw = nx.draw_networkx_nodes(self.uesgraph,
-                                                  pos=self.uesgraph.positions,
+                                                  pos=positions,
                                                   nodelist=[building],
                                                   node_color='blue',
                                                   node_size=60 *
@@ -407,7 +403,7 @@ class Visuals(object):
                         draw.set_edgecolor('blue')
                 if self.uesgraph.node[building]['is_supply_gas'] is True:
                     draw = nx.draw_networkx_nodes(self.uesgraph,
-                                                  pos=self.uesgraph.positions,
+                                                  pos=positions,
                                                   nodelist=[building],
                                                   node_color='gray',
                                                   node_size=40 *
@@ -417,7 +413,7 @@ class Visuals(object):
                         draw.set_edgecolor('gray')
 
                 draw = nx.draw_networkx_nodes(self.uesgraph,
-                                              pos=self.uesgraph.positions,
+                                              pos=positions,
                                               nodelist=[building],
                                               node_size=25 * scaling_factor,
                                               node_color='green',
@@ -444,7 +440,7 @@ class Visuals(object):
                 if self.uesgraph.node[building][
                         'is_supply_electricity'] is True:
                     draw = nx.draw_networkx_nodes(self.uesgraph,
-                                                  pos=self.uesgraph.positions,
+                                                  pos=positions,
                                                   nodelist=[building],
                                                   node_color='orange',
                                                   node_size=12 *
@@ -455,7 +451,7 @@ class Visuals(object):
                         draw.set_edgecolor('orange')
                 if self.uesgraph.node[building]['is_supply_other'] is True:
                     draw = nx.draw_networkx_nodes(self.uesgraph,
-                                                  pos=self.uesgraph.positions,
+                                                  pos=positions,
                                                   nodelist=[building],
                                                   node_color='purple',
                                                   node_size=5 *
@@ -465,31 +461,27 @@ class Visuals(object):
                     if draw is not None:
                         draw.set_edgecolor('purple')
 
-        for edge in self.uesgraph.edges():
+        for node_0, node_1, edge_data in self.uesgraph.edges(data=True):
+            edge = (node_0, node_1)
             for node in edge:
                 color = 'black'
                 style = 'solid'
                 alpha = 1
 
                 if show_diameters is True:
-                    if 'diameter' in self.uesgraph.edges[
-                            edge[0], edge[1]]:
-                        weight = self.uesgraph.edges[edge[0], edge[1]][
-                                     'diameter'] * scaling_factor_diameter
+                    if 'diameter' in edge_data:
+                        weight = edge_data['diameter'] * \
+                            scaling_factor_diameter
                     else:
                         weight = 0.01
                 elif show_mass_flows is True:
-                    if 'mass_flow' in self.uesgraph.edges[
-                            edge[0], edge[1]]:
-                        weight = abs(self.uesgraph.edges[edge[0], edge[1]][
-                                         'mass_flow']) / mass_flow_max * 10
-                    elif 'volume_flow' in self.uesgraph.edge[
-                            edge[0]][edge[1]]:
-                        weight = abs(self.uesgraph.edges[edge[0], edge[1]][
-                                         'volume_flow']) / volume_flow_max * 10
-                        if weight < 0.5 and self.uesgraph.edges[edge[0],
-                                                                edge[1]][
-                            'volume_flow'] > 1e-9:
+                    if 'mass_flow' in edge_data:
+                        weight = abs(edge_data['mass_flow']) / \
+                            mass_flow_max * 10
+                    elif 'volume_flow' in edge_data:
+                        weight = abs(edge_data['volume_flow']) / \
+                            volume_flow_max * 10
+                        if weight < 0.5 and edge_data['volume_flow'] > 1e-9:
                             weight = 10.5
                     else:
                         weight = 0.01
@@ -527,7 +519,7 @@ class Visuals(object):
 
             if show_diameters is True or show_mass_flows is True:
                 nx.draw_networkx_edges(self.uesgraph,
-                                       pos=self.uesgraph.positions,
+                                       pos=positions,
                                        edgelist=[edge],
                                        style=style,
                                        width=weight,
@@ -535,17 +527,17 @@ class Visuals(object):
                                        alpha=alpha)
             else:
                 nx.draw_networkx_edges(self.uesgraph,
-                                       pos=self.uesgraph.positions,
+                                       pos=positions,
                                        edgelist=[edge],
                                        style=style,
                                        edge_color=[color],
                                        alpha=alpha)
             if labels == 'name':
-                if 'name' in self.uesgraph.edges[edge[0], edge[1]]:
+                if 'name' in edge_data:
                     text_pos = self._place_text(edge)
                     plt.text(text_pos.x,
                              text_pos.y,
-                             s=self.uesgraph.edges[edge[0], edge[1]]['name'],
+                             s=edge_data['name'],
                              horizontalalignment='center',
                              fontsize=label_size)
 
@@ -633,18 +625,16 @@ class Visuals(object):
         """
         if show_flow is True:
             flows = []
-            for edge in self.uesgraph.edges():
-                flows.append(self.uesgraph.edge[
-                                 edge[0]][edge[1]]['volume_flow'])
+            for edge in self.uesgraph.edges(data=True):
+                flows.append(edge[2]['volume_flow'])
             min_flow = min(flows)
             max_flow = max(flows)
             delta_flow = max_flow - min_flow
 
-            for edge in self.uesgraph.edges():
-                flow = self.uesgraph.edge[edge[0]][edge[1]]['volume_flow']
+            for edge in self.uesgraph.edges(data=True):
+                flow = edge[2]['volume_flow']
                 weight = ((flow - min_flow) / delta_flow) * 3
-                print('weight', weight)
-                self.uesgraph.edge[edge[0]][edge[1]]['weight'] = weight + 0.1
+                edge[2]['weight'] = weight + 0.1
 
         for node in self.uesgraph.nodes():
             if z_attrib in self.uesgraph.node[node]:
@@ -653,7 +643,7 @@ class Visuals(object):
                 z = self.uesgraph.node[node][z_attrib] * 1e-5
                 ax.scatter(x, y, zs=z, zdir='z', c='0.5', alpha=0.5)
 
-        for edge in self.uesgraph.edges():
+        for edge in self.uesgraph.edges(data=True):
             if (z_attrib in self.uesgraph.node[edge[0]] and
                     z_attrib in self.uesgraph.node[edge[1]]):
                 x = [self.uesgraph.node[edge[0]]['position'].x,
@@ -666,7 +656,7 @@ class Visuals(object):
                     ax.plot(x, y, zs=z, zdir='z', ls='-', color='grey',
                             alpha=0.5)
                 else:
-                    linewidth = self.uesgraph.edge[edge[0]][edge[1]]['weight']
+                    linewidth = edge[2]['weight']
                     ax.plot(x, y, zs=z, zdir='z', ls='-', color='grey',
                             alpha=0.5, linewidth=linewidth)
         for node in self.uesgraph.nodes():
@@ -805,8 +795,6 @@ class Visuals(object):
                 if 'temperature_supply' in self.uesgraph.node[node]:
                     temperatures.append(self.uesgraph.node[node][
                                             'temperature_supply'])
-                    print(node, self.uesgraph.node[node][
-                        'temperature_supply'])
             mean_temperature = np.mean(temperatures)
             std_temperatures = np.std(temperatures)
             temperature_min = 56.21334421417651
@@ -1095,20 +1083,24 @@ class Visuals(object):
 
         # Add layer for heating networks
         if 'all' in networks or 'heating' in networks:
-            if len(heating_graphs[list(heating_graphs.keys())[0]].nodes()) > 0:
+            if heating_graphs and len(next(iter(heating_graphs.values()))) > 0:
                 ax = self._add_network_layer_3d(ax, 'heating',
                                                 level_counter,
                                                 scaling_factor,
-                                                dotted_lines=dotted_lines)
+                                                dotted_lines=dotted_lines,
+                                                graph_dict=heating_graphs,
+                                                building_graph=building_graph)
                 level_counter += z_step
 
         # Add layer for cooling networks
         if 'all' in networks or 'cooling' in networks:
-            if len(cooling_graphs[list(cooling_graphs.keys())[0]].nodes()) > 0:
+            if cooling_graphs and len(next(iter(cooling_graphs.values()))) > 0:
                 ax = self._add_network_layer_3d(ax, 'cooling',
                                                 level_counter,
                                                 scaling_factor,
-                                                dotted_lines=dotted_lines)
+                                                dotted_lines=dotted_lines,
+                                                graph_dict=cooling_graphs,
+                                                building_graph=building_graph)
                 level_counter += z_step
 
         # Add layer for electricity networks
@@ -1117,7 +1109,9 @@ class Visuals(object):
                 ax = self._add_network_layer_3d(ax, 'electricity',
                                                 level_counter,
                                                 scaling_factor,
-                                                dotted_lines=dotted_lines)
+                                                dotted_lines=dotted_lines,
+                                                graph_dict=electricity_graphs,
+                                                building_graph=building_graph)
                 level_counter += z_step
 
         # Add layer for gas networks
@@ -1126,7 +1120,9 @@ class Visuals(object):
                 ax = self._add_network_layer_3d(ax, 'gas',
                                                 level_counter,
                                                 scaling_factor,
-                                                dotted_lines=dotted_lines)
+                                                dotted_lines=dotted_lines,
+                                                graph_dict=gas_graphs,
+                                                building_graph=building_graph)
                 level_counter += z_step
 
         # Add layer for other networks
@@ -1135,7 +1131,9 @@ class Visuals(object):
                 ax = self._add_network_layer_3d(ax, 'others',
                                                 level_counter,
                                                 scaling_factor,
-                                                dotted_lines=dotted_lines)
+                                                dotted_lines=dotted_lines,
+                                                graph_dict=other_graphs,
+                                                building_graph=building_graph)
                 level_counter += z_step
 
         ax.view_init(20, angle)
@@ -1162,7 +1160,8 @@ class Visuals(object):
 
 
     def _add_network_layer_3d(self, ax, network_type, z_level,
-                              scaling_factor, dotted_lines, streets=False):
+                              scaling_factor, dotted_lines, graph_dict,
+                              building_graph, streets=False):
         """Adds network of `network_type` to `z_level` of the plot in `ax`
 
         Parameters
@@ -1179,6 +1178,13 @@ class Visuals(object):
         dotted_lines : boolean
             Optional dotted lines between different levels of network
             explosion if set to True
+        graph_dict : dict
+            Subgraphs of `network_type` as returned by
+            `UESGraph.create_subgraphs(network_type, all_buildings=False)`
+        building_graph : uesgraphs.uesgraph.UESGraph
+            Subgraph of buildings and streets as returned by
+            `UESGraph.create_subgraphs(None, all_buildings=False,
+            streets=True)['default']`
         streets : boolean
             Adds street edges to network layer representation if True
 
@@ -1186,13 +1192,6 @@ class Visuals(object):
         -------
         ax : maplotlib ax object
         """
-        building_graph = self.uesgraph.create_subgraphs(None,
-                                                        all_buildings=False,
-                                                        streets=True)[
-                                                            'default']
-        graph_dict = self.uesgraph.create_subgraphs(network_type,
-                                                    all_buildings=False)
-
         if network_type == 'heating':
             network_color = 'red'
         elif network_type == 'cooling':
@@ -1339,43 +1338,41 @@ class Visuals(object):
         """
         scaling = 3
         if add_temperatures is True:
-            temperatures = []
-            for node in self.uesgraph.nodes():
-                if 'temperature_supply' in self.uesgraph.node[node]:
-                    temperatures.append(self.uesgraph.node[node][
-                        'temperature_supply'])
-            mean_temperature = np.mean(temperatures)
-            std_temperatures = np.std(temperatures)
-            temperature_min = max(min(temperatures),
+            temperatures = np.array(
+                [data['temperature_supply'] for node, data in
+                 self.uesgraph.nodes(data=True)
+                 if 'temperature_supply' in data])
+            mean_temperature = temperatures.mean()
+            std_temperatures = temperatures.std()
+            temperature_min = max(temperatures.min(),
                                   mean_temperature - 2 * std_temperatures)
-            temperature_max = min(max(temperatures),
+            temperature_max = min(temperatures.max(),
                                   mean_temperature + 2 * std_temperatures)
 
             print('temperature_min', temperature_min)
             print('temperature_max', temperature_max)
 
         if add_flows is True:
-            mass_flows = []
-            for edge in self.uesgraph.edges():
-                mass_flows.append(self.uesgraph.edges[edge[0], edge[1]][
-                                      'mass_flow'])
-            mass_flow_max = max(mass_flows)
+            mass_flows = np.array(
+                [data['mass_flow'] for node_0, node_1, data in
+                 self.uesgraph.edges(data=True)])
+            mass_flow_max = mass_flows.max()
 
-        for edge in self.uesgraph.edges():
+        if len(self.uesgraph.edges()) < 25:
+            temperature_discretization = 100
+        else:
+            temperature_discretization = 20
+
+        for edge in self.uesgraph.edges(data=True):
             start = self.uesgraph.node[edge[0]]['position']
             end = self.uesgraph.node[edge[1]]['position']
-            delta = start.distance(end)
-            line = sg.LineString([start, end])
 
             T_added = False
             if add_temperatures is True:
                 if 'temperature_supply' in self.uesgraph.node[
                         edge[0]] and 'temperature_supply' in \
                         self.uesgraph.node[edge[1]]:
-                    if len(self.uesgraph.edges()) < 25:
-                        discretization = 100
-                    else:
-                        discretization = 20
+                    discretization = temperature_discretization
                     T1 = self.uesgraph.node[edge[0]]['temperature_supply']
                     T2 = self.uesgraph.node[edge[1]]['temperature_supply']
                     T_added = True
@@ -1386,22 +1383,16 @@ class Visuals(object):
 
             flow_added = False
             if add_flows is True:
-                if 'mass_flow' in self.uesgraph.edges[edge[0], edge[1]]:
-                    mass_flow = self.uesgraph.edges[edge[0], edge[1]][
-                        'mass_flow']
+                if 'mass_flow' in edge[2]:
+                    mass_flow = edge[2]['mass_flow']
                     linewidth = 1 + 4 * abs(mass_flow)/mass_flow_max
                     flow_added = True
 
             if flow_added is False:
                 linewidth = 1
 
-            t = np.linspace(0, 1, discretization)
-            x = []
-            y = []
-            for i in t:
-                here = line.interpolate(delta*i)
-                x.append(float(here.x))
-                y.append(float(here.y))
+            x = np.linspace(start.x, end.x, discretization)
+            y = np.linspace(start.y, end.y, discretization)
 
             t = np.linspace(T1, T2, discretization)
 
@@ -1416,7 +1407,6 @@ class Visuals(object):
                 lc.set_array(t)
             else:
                 colors = [matplotlib.colors.colorConverter.to_rgba('r')]
-                print('colors', colors)
                 lc = LineCollection(segments, colors=colors)
 
             lc.set_linewidth(linewidth*scaling)
@@ -1425,9 +1415,8 @@ class Visuals(object):
 
             if directions is True and add_flows is True:
                 # Plot arrows for assumed flow direction
-                for edge in self.uesgraph.edges():
-                    mass_flow = self.uesgraph.edge[edge[0]][edge[1]][
-                        'mass_flow']
+                for edge in self.uesgraph.edges(data=True):
+                    mass_flow = edge[2]['mass_flow']
                     if mass_flow > 0:
                         pos_0 = self.uesgraph.node[edge[0]]['position']
                         pos_1 = self.uesgraph.node[edge[1]]['position']